@@ -2,9 +2,10 @@
 Blizzard API Client - Implementation of BlizzardAPIPort.
 
 This adapter handles:
-- OAuth2 authentication with Battle.net
-- HTTP requests to the Blizzard API
-- Rate limiting via semaphores
+- OAuth2 authentication with Battle.net (tokens cached on disk across processes)
+- HTTP requests to the Blizzard API (pooled HTTP/2 connections)
+- On-disk caching with conditional GETs for static-namespace endpoints
+- Rate limiting via a client-wide request semaphore and token buckets
 - Transformation of raw API responses into domain models
 
 All API response parsing logic is encapsulated here, keeping the domain
@@ -12,10 +13,22 @@ layer pure and free from external data format knowledge.
 """
 
 import asyncio
+import contextlib
+import hashlib
+import itertools
+import logging
+import operator
+import random
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
 import httpx
+import ijson
+import orjson
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 
 from domain.models import (
@@ -31,8 +44,51 @@ from domain.models import (
     Recipe,
     RecipeReagent,
 )
+from adapters.blizzard_api.rate_limiter import TokenBucket
+from adapters.blizzard_api.response_cache import ResponseCache, default_cache_dir, ensure_private_dir, is_owned_by_user, write_atomic
 from ports.blizzard_api import BlizzardAPIPort
 
+logger = logging.getLogger(__name__)
+
+# ijson silently picks the best available backend; the pure-Python one is ~50x slower
+if ijson.backend == "python":
+    logger.warning("ijson C backend (yajl2_c) unavailable, auction parsing uses the slow pure-Python backend")
+
+T = TypeVar("T")
+
+# Keys present on every auction entry; price fields are optional and read with .get
+_AUCTION_KEYS = operator.itemgetter("id", "item", "quantity", "time_left")
+
+# Bytes handed to the JSON parser per read; HTTP/2 DATA frames are ~16 KB
+_STREAM_CHUNK_SIZE = 256 * 1024
+
+# Shared read-only default for missing nested objects in API responses
+_EMPTY = MappingProxyType({})
+
+
+def _intern(value):
+    """Return the shared instance of a low-cardinality API string (non-strings are returned unchanged)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class _AsyncResponseReader:
+    """
+    Expose a streaming httpx response as the async file-like object ijson reads from.
+
+    Network chunks are coalesced into fixed-size blocks so the parser is resumed
+    once per block rather than once per frame.
+    """
+
+    def __init__(self, response: httpx.Response, chunk_size: int = _STREAM_CHUNK_SIZE):
+        self._chunks = response.aiter_bytes(chunk_size)
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next received chunk, or b"" at the end of the stream."""
+        if size == 0:
+            # ijson probes with read(0) to detect bytes vs str streams
+            return b""
+        return await anext(self._chunks, b"")
+
 
 class BlizzardAPIClient(BlizzardAPIPort):
     """
@@ -66,12 +122,40 @@ class BlizzardAPIClient(BlizzardAPIPort):
         },
     }
 
+    # Auction payloads are several MB, so allow a generous read timeout
+    REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+    # Transient failures worth retrying (rate limited or upstream hiccups)
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 60.0
+
+    # Largest page size accepted by the search endpoints
+    SEARCH_PAGE_SIZE = 1000
+
+    # Concurrent streams Blizzard's edge accepts on one HTTP/2 connection
+    HTTP2_STREAMS_PER_CONNECTION = 100
+
+    # Default number of realms fetched at once by a realm auction scan. Each realm is a
+    # multi-MB parsed snapshot held until consumed, so this stays far below the HTTP limit.
+    REALM_AUCTION_CONCURRENCY = 5
+
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         region: str = "eu",
         locale: str = "en_GB",
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        http2: bool = True,
+        max_concurrent_requests: int = 100,
+        requests_per_second: int = 100,
+        requests_per_hour: int = 36000,
+        max_retries: int = 5,
+        token_cache_path: Optional[str | Path] = None,
+        static_cache_dir: Optional[str | Path] = None,
+        static_cache_ttl: float = 7 * 24 * 3600,
     ):
         """
         Initialize the Blizzard API client.
@@ -81,11 +165,40 @@ class BlizzardAPIClient(BlizzardAPIPort):
             client_secret: Battle.net API client secret.
             region: API region (us, eu, kr, tw, cn).
             locale: Locale for response data (e.g., en_US, en_GB, fr_FR).
+            max_connections: Maximum number of connections in the HTTP pool (with HTTP/2 each
+                             connection multiplexes many requests, so a few are enough).
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            http2: Whether to negotiate HTTP/2 (multiplexes requests over fewer connections).
+            max_concurrent_requests: Maximum number of in-flight requests, shared by all methods.
+            requests_per_second: Blizzard per-second request quota.
+            requests_per_hour: Blizzard hourly request quota.
+            max_retries: Maximum number of retries for transient failures (429, 5xx, network errors).
+            token_cache_path: File used to share the OAuth token between processes
+                             (defaults to a per-client file in the per-user cache directory).
+            static_cache_dir: Directory caching static-namespace responses
+                             (defaults to a directory in the per-user cache directory).
+            static_cache_ttl: Seconds a cached static response is used before being revalidated.
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.region = region.lower()
         self.locale = locale
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30.0,
+        )
+        self.http2 = http2
+        streams_per_connection = self.HTTP2_STREAMS_PER_CONNECTION if http2 else 1
+        self.max_concurrent_requests = min(max_concurrent_requests, max_connections * streams_per_connection)
+        # Single throttle shared by every API call made during the client lifetime
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        # Stay under Blizzard quotas instead of reacting to 429 responses
+        self._rate_limits = (
+            TokenBucket(requests_per_second, period=1.0),
+            TokenBucket(requests_per_hour, period=3600.0),
+        )
+        self.max_retries = max_retries
 
         if self.region not in self.REGION_CONFIG:
             raise ValueError(f"Invalid region: {region}")
@@ -93,26 +206,66 @@ class BlizzardAPIClient(BlizzardAPIPort):
         config = self.REGION_CONFIG[self.region]
         self.token_url = config["token_url"]
         self.api_base = config["api_base"]
+        self._base_params = {namespace: {"namespace": f"{namespace}-{self.region}", "locale": self.locale} for namespace in ("dynamic", "static")}
+
+        if token_cache_path is None:
+            cache_key = hashlib.sha256(f"{client_id}:{self.token_url}".encode()).hexdigest()[:16]
+            token_cache_path = default_cache_dir() / f"blizzard_token_{cache_key}.json"
+        self.token_cache_path = Path(token_cache_path)
+
+        if static_cache_dir is None:
+            static_cache_dir = default_cache_dir() / "blizzard_api_cache"
+        self._static_cache = ResponseCache(static_cache_dir, ttl=static_cache_ttl)
 
         self._client: Optional[AsyncOAuth2Client] = None
-        self._token_expires_at: Optional[float] = None
+        self._token_expires_at: Optional[float] = None  # time.monotonic() deadline
+        # Serializes re-authentication so concurrent requests don't each fetch a token
+        self._token_lock = asyncio.Lock()
+        # Requests currently in flight, keyed by URL and query parameters
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Number of callers awaiting each in-flight request
+        self._inflight_waiters: dict[asyncio.Future, int] = {}
+        self._context_depth = 0
 
     # =========================================================================
     # Context Manager
     # =========================================================================
 
     async def __aenter__(self) -> "BlizzardAPIClient":
-        """Initialize the OAuth2 client."""
-        self._client = AsyncOAuth2Client(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-        )
-        await self._authenticate()
+        """
+        Initialize the OAuth2 client and its shared connection pool.
+
+        Re-entering an already open client reuses the existing pool instead of
+        creating (and leaking) a second one; it is closed on the outermost exit.
+        """
+        if self._client is None:
+            self._client = AsyncOAuth2Client(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            try:
+                await self._authenticate()
+            except BaseException:
+                # __aexit__ won't run: close the pool so the next entry starts from scratch
+                await self._client.aclose()
+                self._client = None
+                raise
+        # Only count the context once setup succeeded
+        self._context_depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Close the HTTP client."""
-        if self._client:
+        """Close the HTTP client when leaving the outermost context."""
+        self._context_depth -= 1
+        if self._context_depth == 0 and self._client:
+            # Shared requests must not outlive the pool they send on
+            inflight = list(self._inflight.values())
+            for request in inflight:
+                request.cancel()
+            await asyncio.gather(*inflight, return_exceptions=True)
             await self._client.aclose()
             self._client = None
 
@@ -120,26 +273,98 @@ class BlizzardAPIClient(BlizzardAPIPort):
     # Authentication
     # =========================================================================
 
-    async def _authenticate(self) -> None:
-        """Obtain OAuth2 access token using client credentials flow."""
-        token = await self._client.fetch_token(
-            self.token_url,
-            grant_type="client_credentials",
-        )
-        # Store expiration time with a small buffer
-        self._token_expires_at = token.get("expires_at", 0) - 60
+    async def _authenticate(self, use_cache: bool = True) -> None:
+        """
+        Obtain OAuth2 access token, reusing a still-valid cached token when possible.
+
+        Args:
+            use_cache: Whether a cached token may be reused (False forces a new token).
+        """
+        token = self._load_cached_token() if use_cache else None
+        if token is not None:
+            logger.debug("Reusing cached OAuth token from %s", self.token_cache_path)
+            self._client.token = token
+        else:
+            token = await self._client.fetch_token(
+                self.token_url,
+                grant_type="client_credentials",
+            )
+            logger.info("Fetched new OAuth token from %s", self.token_url)
+            self._store_cached_token(dict(token))
+        # Track expiry (with a small buffer) on the monotonic clock, immune to wall-clock jumps;
+        # expires_at is the only lifetime a cached token carries, so derive the remaining time from it
+        expires_in = token.get("expires_at", 0) - time.time()
+        self._token_expires_at = time.monotonic() + expires_in - 60
+
+    def _load_cached_token(self) -> Optional[dict]:
+        """Return the cached token if it exists, belongs to the current user and is not about to expire."""
+        try:
+            # A file planted by another user could hand us a token for someone else's credentials
+            if not is_owned_by_user(self.token_cache_path):
+                return None
+            token = orjson.loads(self.token_cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(token, dict) or token.get("expires_at", 0) - 60 <= time.time():
+            return None
+        return token
+
+    def _store_cached_token(self, token: dict) -> None:
+        """Atomically write the token to the cache file, readable by the owner only."""
+        try:
+            ensure_private_dir(self.token_cache_path.parent)
+            write_atomic(self.token_cache_path, orjson.dumps(token), mode=0o600)
+        except OSError:
+            # Caching is best effort; the token is still usable in this process
+            pass
 
     async def _ensure_valid_token(self) -> None:
         """Re-authenticate if the token is expired or about to expire."""
-        import time
+        if self._token_expired():
+            async with self._token_lock:
+                # Another request may have refreshed the token while we waited
+                if self._token_expired():
+                    await self._authenticate()
 
-        if self._token_expires_at is None or time.time() >= self._token_expires_at:
-            await self._authenticate()
+    async def _reauthenticate(self, rejected: httpx.Request) -> None:
+        """
+        Replace a token the API rejected (revoked, or cached for other credentials).
+
+        The cached token is discarded and a new one fetched, unless another
+        request already replaced the token that was sent with `rejected`.
+        """
+        async with self._token_lock:
+            current = (self._client.token or {}).get("access_token")
+            sent = rejected.headers.get("Authorization", "").rpartition(" ")[2]
+            if current is not None and current != sent:
+                return
+            logger.warning("OAuth token rejected, fetching a new one")
+            with contextlib.suppress(OSError):
+                self.token_cache_path.unlink(missing_ok=True)
+            await self._authenticate(use_cache=False)
+
+    def _token_expired(self) -> bool:
+        """Whether the current token is missing or within its expiry buffer."""
+        return self._token_expires_at is None or time.monotonic() >= self._token_expires_at
 
     # =========================================================================
     # HTTP Methods
     # =========================================================================
 
+    def _request_params(self, params: Optional[dict], namespace: str) -> dict:
+        """
+        Build query parameters with the namespace and locale every endpoint requires.
+
+        Without extra params the prebuilt per-namespace dict is returned as is
+        (callers must not mutate it); a new dict is only built when merging params.
+        """
+        base_params = self._base_params.get(namespace)
+        if base_params is None:
+            base_params = {"namespace": f"{namespace}-{self.region}", "locale": self.locale}
+        if params:
+            return {**base_params, **params}
+        return base_params
+
     async def _get(
         self,
         endpoint: str,
@@ -159,20 +384,213 @@ class BlizzardAPIClient(BlizzardAPIPort):
 
         Raises:
             httpx.HTTPStatusError: If the request fails.
+            httpx.TransportError: If the request cannot be sent after all retries.
         """
-        await self._ensure_valid_token()
+        url = f"{self.api_base}{endpoint}"
+        request_params = self._request_params(params, namespace)
+
+        # Single-flight: concurrent identical requests share one HTTP round trip
+        key = (url, tuple(sorted(request_params.items())))
+        request = self._inflight.get(key)
+        if request is None:
+            if namespace == "static":
+                request = asyncio.ensure_future(self._with_retry(lambda: self._fetch_cached_json(url, request_params)))
+            else:
+                request = asyncio.ensure_future(self._with_retry(lambda: self._fetch_json(url, request_params)))
+            self._inflight[key] = request
+            request.add_done_callback(lambda done: self._forget_request(key, done))
+        waiters = self._inflight_waiters
+        waiters[request] = waiters.get(request, 0) + 1
+        try:
+            # Shielded so one caller being cancelled doesn't cancel the request for the others
+            return await asyncio.shield(request)
+        except asyncio.CancelledError:
+            # ... but once the last caller is gone nobody needs the response any more
+            if waiters[request] == 1 and not request.done():
+                self._forget_request(key, request)
+                request.cancel()
+            raise
+        finally:
+            waiters[request] -= 1
+            if not waiters[request]:
+                del waiters[request]
 
-        full_namespace = f"{namespace}-{self.region}"
-        request_params = {
-            "namespace": full_namespace,
-            "locale": self.locale,
-            **(params or {}),
-        }
+    def _forget_request(self, key: tuple, request: asyncio.Future) -> None:
+        """Stop sharing a request with new callers (a newer request for the same key is kept)."""
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
 
-        url = f"{self.api_base}{endpoint}"
-        response = await self._client.get(url, params=request_params)
+    async def _with_retry(self, attempt_request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request attempt, retrying transient failures.
+
+        Transient failures (429, 5xx, network errors) are retried with
+        exponential backoff and jitter, honoring the Retry-After header.
+        A 401 is retried once, immediately, with a new token.
+        """
+        reauthenticated = False
+        attempt = 0
+        while True:
+            try:
+                return await attempt_request()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == httpx.codes.UNAUTHORIZED and not reauthenticated:
+                    reauthenticated = True
+                    await self._reauthenticate(e.request)
+                    continue
+                if e.response.status_code not in self.RETRYABLE_STATUS_CODES:
+                    raise
+                reason = f"HTTP {e.response.status_code}"
+                if attempt == self.max_retries:
+                    logger.error("Request failed (%s), giving up after %d retries", reason, self.max_retries)
+                    raise
+                delay = self._retry_delay(attempt, e.response)
+            except httpx.TransportError as e:
+                reason = type(e).__name__
+                if attempt == self.max_retries:
+                    logger.error("Request failed (%s), giving up after %d retries", reason, self.max_retries)
+                    raise
+                delay = self._retry_delay(attempt)
+            logger.warning("Request failed (%s), retrying in %.1fs (attempt %d/%d)", reason, delay, attempt + 1, self.max_retries)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @contextlib.asynccontextmanager
+    async def _throttled(self) -> AsyncIterator[None]:
+        """Hold a request slot: valid token, client-wide semaphore and rate-limit tokens."""
+        # Checked inline so requests with a fresh token skip the coroutine call entirely
+        if self._token_expired():
+            await self._ensure_valid_token()
+        async with self._request_semaphore:
+            for bucket in self._rate_limits:
+                await bucket.acquire()
+            yield
+
+    async def _fetch_json(self, url: str, params: dict) -> dict:
+        """Send a single throttled GET request and decode the JSON body."""
+        async with self._throttled():
+            response = await self._client.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        # Decode the raw bytes directly, skipping httpx's str decode + stdlib json
+        return orjson.loads(response.content)
+
+    async def _fetch_cached_json(self, url: str, params: dict) -> dict:
+        """
+        Serve a request from the static response cache, revalidating stale entries.
+
+        Fresh entries skip the network entirely; stale ones are revalidated with
+        a conditional GET and reused on 304 Not Modified. Cache file I/O runs
+        in a worker thread so it doesn't stall the event loop.
+        """
+        cached = await asyncio.to_thread(self._static_cache.get, url, params)
+        if cached is not None and cached.is_fresh(self._static_cache.ttl):
+            return cached.data
+
+        async with self._throttled():
+            response = await self._client.get(url, params=params, headers=cached.validators() if cached else None)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            await asyncio.to_thread(self._static_cache.touch, url, params)
+            return cached.data
+
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        await asyncio.to_thread(
+            self._static_cache.put,
+            url,
+            params,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return data
+
+    async def _fetch_auctions(self, url: str, params: dict) -> list[Auction]:
+        """
+        Send a single throttled GET request and parse auctions while streaming.
+
+        Auction payloads are several MB; parsing them incrementally avoids
+        holding the raw body and the full decoded dict tree in memory at once.
+        """
+        async with self._throttled():
+            async with self._client.stream("GET", url, params=params) as response:
+                response.raise_for_status()
+                logger.debug("Streaming %s over %s", url, response.http_version)
+                reader = _AsyncResponseReader(response)
+                # A realm has far fewer distinct items, bonus list / modifier combinations and
+                # durations than auctions, so auctions share one instance per distinct value
+                interned: dict = {}
+                return [self._parse_auction(auction_dict, interned) async for auction_dict in ijson.items(reader, "auctions.item")]
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Compute the delay before the next attempt, preferring the server's Retry-After hint."""
+        if response is not None:
+            try:
+                # Clamped so a bogus or hostile header can't stall retries indefinitely
+                return max(0.0, min(self.RETRY_MAX_DELAY, float(response.headers.get("Retry-After", ""))))
+            except ValueError:
+                pass
+        return min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt) + random.uniform(0, self.RETRY_BASE_DELAY)
+
+    def _batch_semaphore(self, max_concurrent: Optional[int]) -> asyncio.Semaphore | contextlib.nullcontext:
+        """
+        Return the throttle for a batch of requests.
+
+        Requests are always bounded by the client-wide semaphore in `_get`;
+        a per-batch semaphore is only added when the caller asks for a lower limit.
+        """
+        if max_concurrent is None or max_concurrent >= self.max_concurrent_requests:
+            return contextlib.nullcontext()
+        return asyncio.Semaphore(max_concurrent)
+
+    async def _fetch_many(
+        self,
+        ids: list[int],
+        fetch: Callable[[int], Awaitable[Optional[T]]],
+        max_concurrent: Optional[int] = None,
+    ) -> dict[int, T]:
+        """
+        Fetch several resources by ID concurrently.
+
+        Duplicate IDs are requested once and resources that were not found are skipped.
+        """
+        semaphore = self._batch_semaphore(max_concurrent)
+
+        async def fetch_one(resource_id: int) -> tuple[int, Optional[T]]:
+            async with semaphore:
+                return resource_id, await fetch(resource_id)
+
+        results = await asyncio.gather(*(fetch_one(resource_id) for resource_id in dict.fromkeys(ids)))
+        return {resource_id: resource for resource_id, resource in results if resource is not None}
+
+    async def _iter_search(self, endpoint: str, name: Optional[str], order_by: str) -> AsyncIterator[dict]:
+        """
+        Iterate over every result of a search endpoint, page by page.
+
+        The next page is requested before the current one is handed out, so
+        its round trip overlaps with the caller's processing.
+        """
+        params = {"orderby": order_by, "_pageSize": self.SEARCH_PAGE_SIZE}
+        if name:
+            params["name.en_US"] = name
+
+        def fetch_page(page: int) -> asyncio.Task:
+            return asyncio.create_task(self._get(endpoint, params={**params, "_page": page}, namespace="static"))
+
+        page = 1
+        next_page = fetch_page(page)
+        try:
+            while next_page is not None:
+                data = await next_page
+                results = data.get("results", [])
+                has_more = bool(results) and page < data.get("pageCount", page)
+                page += 1
+                next_page = fetch_page(page) if has_more else None
+                for result in results:
+                    yield result
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     # =========================================================================
     # Realm Methods
@@ -183,11 +601,11 @@ class BlizzardAPIClient(BlizzardAPIPort):
         data = await self._get("/data/wow/connected-realm/index")
         realm_ids = []
         for realm in data.get("connected_realms", []):
-            href = realm.get("href", "")
             # Extract ID from URL like ".../connected-realm/123?..."
-            if "/connected-realm/" in href:
-                realm_id = int(href.split("/connected-realm/")[1].split("?")[0])
-                realm_ids.append(realm_id)
+            _, _, tail = realm.get("href", "").partition("/connected-realm/")
+            realm_id, _, _ = tail.partition("?")
+            if realm_id.isdigit():
+                realm_ids.append(int(realm_id))
         return realm_ids
 
     async def get_connected_realm(self, realm_id: int) -> Optional[ConnectedRealm]:
@@ -200,32 +618,22 @@ class BlizzardAPIClient(BlizzardAPIPort):
                 return None
             raise
 
-    async def get_all_connected_realms(self, realm_ids: Optional[list[int]] = None, max_concurrent: int = 10) -> dict[int, ConnectedRealm]:
+    async def get_all_connected_realms(self, realm_ids: Optional[list[int]] = None, max_concurrent: Optional[int] = None) -> dict[int, ConnectedRealm]:
         """Fetch details for multiple connected realms concurrently."""
         if realm_ids is None:
             realm_ids = await self.get_connected_realm_ids()
 
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def fetch_realm(rid: int) -> tuple[int, Optional[ConnectedRealm]]:
-            async with semaphore:
-                realm = await self.get_connected_realm(rid)
-                return rid, realm
-
-        tasks = [fetch_realm(rid) for rid in realm_ids]
-        results = await asyncio.gather(*tasks)
-
-        return {rid: realm for rid, realm in results if realm is not None}
+        return await self._fetch_many(realm_ids, self.get_connected_realm, max_concurrent)
 
     def _parse_connected_realm(self, data: dict) -> ConnectedRealm:
         """Parse API response into ConnectedRealm domain model."""
         realms = data.get("realms", [])
         return ConnectedRealm(
             id=data["id"],
-            realm_names=tuple(r.get("name", "") for r in realms),
-            realm_slugs=tuple(r.get("slug", "") for r in realms),
-            status=RealmStatus(data.get("status", {}).get("type", "UP")),
-            population=PopulationType(data.get("population", {}).get("type", "MEDIUM")),
+            realm_names=tuple([r.get("name", "") for r in realms]),
+            realm_slugs=tuple([r.get("slug", "") for r in realms]),
+            status=RealmStatus(data.get("status", _EMPTY).get("type", "UP")),
+            population=PopulationType(data.get("population", _EMPTY).get("type", "MEDIUM")),
             has_queue=data.get("has_queue", False),
         )
 
@@ -235,56 +643,117 @@ class BlizzardAPIClient(BlizzardAPIPort):
 
     async def get_auctions(self, realm_id: int) -> AuctionData:
         """Fetch all auctions for a specific connected realm."""
-        data = await self._get(f"/data/wow/connected-realm/{realm_id}/auctions")
-        return self._parse_auction_data(data, realm_id)
+        return await self._get_auction_data(f"/data/wow/connected-realm/{realm_id}/auctions", realm_id)
 
     async def get_commodity_auctions(self) -> AuctionData:
         """Fetch region-wide commodity auctions."""
-        data = await self._get("/data/wow/auctions/commodities")
         # Commodity auctions use realm_id 0 as a convention
-        return self._parse_auction_data(data, connected_realm_id=0)
-
-    async def get_multiple_realm_auctions(self, realm_ids: list[int], max_concurrent: int = 5) -> dict[int, AuctionData]:
-        """Fetch auctions from multiple realms concurrently."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def fetch_auctions(rid: int) -> tuple[int, AuctionData]:
-            async with semaphore:
-                auctions = await self.get_auctions(rid)
-                return rid, auctions
-
-        tasks = [fetch_auctions(rid) for rid in realm_ids]
-        results = await asyncio.gather(*tasks)
-
-        return {rid: data for rid, data in results}
-
-    def _parse_auction_data(self, data: dict, connected_realm_id: int) -> AuctionData:
-        """Parse API response into AuctionData domain model."""
-        auctions = []
-        for auction_dict in data.get("auctions", []):
-            item_data = auction_dict.get("item", {})
-            item = AuctionItem(
-                id=item_data.get("id", 0),
-                bonus_lists=tuple(item_data.get("bonus_lists", [])),
-                modifiers=tuple((m.get("type", 0), m.get("value", 0)) for m in item_data.get("modifiers", [])),
-            )
-            auction = Auction(
-                id=auction_dict.get("id", 0),
-                item=item,
-                quantity=auction_dict.get("quantity", 1),
-                time_left=auction_dict.get("time_left", "UNKNOWN"),
-                unit_price=auction_dict.get("unit_price"),
-                buyout=auction_dict.get("buyout"),
-                bid=auction_dict.get("bid"),
-            )
-            auctions.append(auction)
+        return await self._get_auction_data("/data/wow/auctions/commodities", connected_realm_id=0)
 
+    async def _get_auction_data(self, endpoint: str, connected_realm_id: int) -> AuctionData:
+        """Stream an auctions endpoint into an AuctionData domain model."""
+        url = f"{self.api_base}{endpoint}"
+        request_params = self._request_params(None, "dynamic")
+        auctions = await self._with_retry(lambda: self._fetch_auctions(url, request_params))
         return AuctionData(
             connected_realm_id=connected_realm_id,
             auctions=auctions,
             fetch_timestamp=datetime.now(timezone.utc),
         )
 
+    async def get_multiple_realm_auctions(self, realm_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, AuctionData]:
+        """Fetch auctions from multiple realms concurrently."""
+        return {rid: data async for rid, data in self.iter_realm_auctions(realm_ids, max_concurrent)}
+
+    async def iter_realm_auctions(self, realm_ids: list[int], max_concurrent: Optional[int] = None) -> AsyncIterator[tuple[int, AuctionData]]:
+        """
+        Fetch auctions from multiple realms concurrently, yielding each realm as it completes.
+
+        At most `max_concurrent` realms (REALM_AUCTION_CONCURRENCY if None) are fetched or
+        waiting to be consumed at any time: a new fetch only starts once a finished realm
+        has been handed to the caller.
+        """
+        limit = min(max_concurrent or self.REALM_AUCTION_CONCURRENCY, self.max_concurrent_requests)
+        pending_ids = iter(realm_ids)
+        in_flight: set[asyncio.Task] = set()
+
+        async def fetch_auctions(rid: int) -> tuple[int, AuctionData]:
+            auctions = await self.get_auctions(rid)
+            logger.debug("Fetched %d auctions for realm %d", len(auctions.auctions), rid)
+            return rid, auctions
+
+        try:
+            while True:
+                for rid in itertools.islice(pending_ids, limit - len(in_flight)):
+                    in_flight.add(asyncio.create_task(fetch_auctions(rid)))
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                # Collect every finished task before yielding, so a failure doesn't leave
+                # the other tasks' exceptions unretrieved
+                results = []
+                error = None
+                for task in done:
+                    try:
+                        results.append(task.result())
+                    except Exception as e:
+                        error = error or e
+                if error is not None:
+                    raise error
+                for result in results:
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def _parse_auction(self, auction_dict: dict, interned: Optional[dict] = None) -> Auction:
+        """
+        Parse a single API auction entry into an Auction domain model.
+
+        Args:
+            auction_dict: Decoded auction entry.
+            interned: Optional cache mapping time_left values, bonus_lists/modifiers tuples and
+                item variants to a shared instance.
+        """
+        try:
+            auction_id, item_data, quantity, time_left = _AUCTION_KEYS(auction_dict)
+        except KeyError:
+            auction_id = auction_dict.get("id", 0)
+            item_data = auction_dict.get("item", _EMPTY)
+            quantity = auction_dict.get("quantity", 1)
+            time_left = auction_dict.get("time_left", "UNKNOWN")
+
+        # Most auctions carry neither field: skip the list building and reuse the empty tuple
+        bonus_lists = item_data.get("bonus_lists")
+        bonus_lists = tuple(bonus_lists) if bonus_lists else ()
+        modifiers = item_data.get("modifiers")
+        modifiers = tuple([(m.get("type", 0), m.get("value", 0)) for m in modifiers]) if modifiers else ()
+        item_id = item_data.get("id", 0)
+        if interned is None:
+            item = AuctionItem(id=item_id, bonus_lists=bonus_lists, modifiers=modifiers)
+        else:
+            # Identical item variants (same id, bonus lists and modifiers) share one AuctionItem
+            time_left = interned.setdefault(time_left, time_left)
+            item_key = (item_id, bonus_lists, modifiers)
+            item = interned.get(item_key)
+            if item is None:
+                item = AuctionItem(
+                    id=item_id,
+                    bonus_lists=interned.setdefault(bonus_lists, bonus_lists),
+                    modifiers=interned.setdefault(modifiers, modifiers),
+                )
+                interned[item_key] = item
+
+        return Auction(
+            id=auction_id,
+            item=item,
+            quantity=quantity,
+            time_left=time_left,
+            unit_price=auction_dict.get("unit_price"),
+            buyout=auction_dict.get("buyout"),
+            bid=auction_dict.get("bid"),
+        )
+
     # =========================================================================
     # Item Methods
     # =========================================================================
@@ -309,6 +778,14 @@ class BlizzardAPIClient(BlizzardAPIPort):
                 return None
             raise
 
+    async def get_items(self, item_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, Item]:
+        """Fetch details for multiple items concurrently."""
+        return await self._fetch_many(item_ids, self.get_item, max_concurrent)
+
+    async def get_items_media(self, item_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, ItemMedia]:
+        """Fetch media for multiple items concurrently."""
+        return await self._fetch_many(item_ids, self.get_item_media, max_concurrent)
+
     async def get_item_classes(self) -> list[dict]:
         """Fetch the item class index."""
         data = await self._get("/data/wow/item-class/index", namespace="static")
@@ -326,16 +803,20 @@ class BlizzardAPIClient(BlizzardAPIPort):
             params["name.en_US"] = name
         return await self._get("/data/wow/search/item", params=params, namespace="static")
 
+    def iter_search_items(self, name: Optional[str] = None, order_by: str = "id") -> AsyncIterator[dict]:
+        """Iterate over all item search results, prefetching the next page."""
+        return self._iter_search("/data/wow/search/item", name, order_by)
+
     def _parse_item(self, data: dict) -> Item:
         """Parse API response into Item domain model."""
         return Item(
             id=data.get("id", 0),
             name=data.get("name", ""),
-            quality=data.get("quality", {}).get("type", "COMMON"),
+            quality=_intern(data.get("quality", _EMPTY).get("type", "COMMON")),
             level=data.get("level", 0),
-            item_class=data.get("item_class", {}).get("name", ""),
-            item_subclass=data.get("item_subclass", {}).get("name", ""),
-            inventory_type=data.get("inventory_type", {}).get("type", ""),
+            item_class=_intern(data.get("item_class", _EMPTY).get("name", "")),
+            item_subclass=_intern(data.get("item_subclass", _EMPTY).get("name", "")),
+            inventory_type=_intern(data.get("inventory_type", _EMPTY).get("type", "")),
             purchase_price=data.get("purchase_price", 0),
             sell_price=data.get("sell_price", 0),
             max_count=data.get("max_count", 0),
@@ -382,6 +863,10 @@ class BlizzardAPIClient(BlizzardAPIPort):
                 return None
             raise
 
+    async def get_recipes(self, recipe_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, Recipe]:
+        """Fetch details for multiple recipes concurrently."""
+        return await self._fetch_many(recipe_ids, self.get_recipe, max_concurrent)
+
     async def search_recipes(
         self,
         name: Optional[str] = None,
@@ -394,11 +879,15 @@ class BlizzardAPIClient(BlizzardAPIPort):
             params["name.en_US"] = name
         return await self._get("/data/wow/search/recipe", params=params, namespace="static")
 
+    def iter_search_recipes(self, name: Optional[str] = None, order_by: str = "id") -> AsyncIterator[dict]:
+        """Iterate over all recipe search results, prefetching the next page."""
+        return self._iter_search("/data/wow/search/recipe", name, order_by)
+
     def _parse_recipe(self, data: dict) -> Recipe:
         """Parse API response into Recipe domain model."""
         reagents = []
         for reagent_data in data.get("reagents", []):
-            reagent_item = reagent_data.get("reagent", {})
+            reagent_item = reagent_data.get("reagent", _EMPTY)
             reagents.append(
                 RecipeReagent(
                     item_id=reagent_item.get("id", 0),
@@ -407,8 +896,8 @@ class BlizzardAPIClient(BlizzardAPIPort):
                 )
             )
 
-        crafted_item = data.get("crafted_item", {})
-        crafted_quantity = data.get("crafted_quantity", {})
+        crafted_item = data.get("crafted_item", _EMPTY)
+        crafted_quantity = data.get("crafted_quantity", _EMPTY)
 
         return Recipe(
             id=data.get("id", 0),
@@ -0,0 +1,47 @@
+"""
+Rate limiter - Async token bucket for proactive API throttling.
+
+Blizzard enforces request quotas (100 requests/second and 36,000 requests/hour
+per client). Waiting for tokens before sending a request keeps the client
+under those caps instead of reacting to 429 responses after the fact.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket admitting at most `capacity` requests per `period` seconds.
+
+    Tokens refill continuously; callers waiting for a token are served in order.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        """
+        Initialize the token bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size).
+            period: Time in seconds needed to refill a full bucket.
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = capacity / period
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, clamped to capacity."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= 1
@@ -0,0 +1,141 @@
+"""
+Response cache - On-disk cache for slowly changing Blizzard API responses.
+
+Static-namespace data (items, recipes, professions, media) rarely changes.
+Each decoded response is stored alongside its validators (ETag / Last-Modified):
+fresh entries are served without any request, stale entries are revalidated
+with a conditional GET so an unchanged resource costs a 304 instead of a
+full download.
+"""
+
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (``$XDG_CACHE_HOME/wow-analytics``, ``~/.cache/wow-analytics`` by default)."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "wow-analytics"
+
+
+def ensure_private_dir(path: Path) -> None:
+    """
+    Create a directory accessible by the current user only, or check an existing one.
+
+    Raises:
+        PermissionError: If the directory is owned by another user.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not is_owned_by_user(path):
+        raise PermissionError(f"{path} is owned by another user")
+    if path.stat().st_mode & 0o077:
+        path.chmod(0o700)
+
+
+def is_owned_by_user(path: Path) -> bool:
+    """Whether a file is owned by the current user (always True where ownership doesn't apply)."""
+    if not hasattr(os, "geteuid"):
+        return True
+    return path.stat().st_uid == os.geteuid()
+
+
+def write_atomic(path: Path, data: bytes, mode: int = 0o644) -> None:
+    """
+    Write bytes to a file atomically (write to a temporary file, then rename).
+
+    Readers in other processes see either the previous or the new content, never a partial file.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached decoded response and the validators needed to revalidate it."""
+
+    data: Any
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """File-per-entry cache of API responses, keyed by URL and query parameters."""
+
+    def __init__(self, directory: str | Path, ttl: float):
+        """
+        Initialize the response cache.
+
+        Args:
+            directory: Directory holding cache entries (created on first write, accessible by the owner only).
+            ttl: Seconds during which an entry is served without revalidation.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _entry_path(self, url: str, params: dict) -> Path:
+        """Return the file path of the entry for a request."""
+        key = orjson.dumps([url, params], option=orjson.OPT_SORT_KEYS)
+        return self.directory / f"{hashlib.sha256(key).hexdigest()}.json"
+
+    def get(self, url: str, params: dict) -> Optional[CachedResponse]:
+        """Return the cached entry for a request, or None if absent, unreadable or not ours."""
+        path = self._entry_path(url, params)
+        try:
+            # Entries planted by another user must not be served as API data
+            if not is_owned_by_user(path):
+                return None
+            entry = orjson.loads(path.read_bytes())
+            # The file's mtime is the storage time, so revalidation only has to touch the file
+            entry.pop("stored_at", None)
+            return CachedResponse(**entry, stored_at=path.stat().st_mtime)
+        except (OSError, orjson.JSONDecodeError, TypeError, AttributeError):
+            return None
+
+    def put(
+        self,
+        url: str,
+        params: dict,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store (or replace) the entry for a request, readable by the owner only. Failures are ignored."""
+        entry = {"data": data, "etag": etag, "last_modified": last_modified}
+        try:
+            ensure_private_dir(self.directory)
+            write_atomic(self._entry_path(url, params), orjson.dumps(entry), mode=0o600)
+        except OSError:
+            pass
+
+    def touch(self, url: str, params: dict) -> None:
+        """Mark the entry for a request as fresh again (after a 304) without rewriting it. Failures are ignored."""
+        try:
+            os.utime(self._entry_path(url, params))
+        except OSError:
+            pass
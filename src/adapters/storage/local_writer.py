@@ -3,13 +3,14 @@ Local Parquet Writer - Implementation of ParquetStoragePort for local filesystem
 
 This adapter writes Parquet files to the local filesystem.
 It has NO knowledge of domain-specific data types - it works purely with
-DataFrames and PyArrow schemas.
+DataFrames, Arrow Tables and PyArrow schemas.
 """
 
 import glob as glob_module
+import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import pandas as pd
 import pyarrow as pa
@@ -18,6 +19,34 @@ import pyarrow.parquet as pq
 from ports.parquet_storage import ParquetStoragePort, StorageError
 
 
+def _walk_files(root: str, suffix: str) -> Iterator[str]:
+    """
+    Yield paths of regular files ending with suffix under root, recursively.
+
+    Uses one os.scandir call per directory and skips hidden entries, like glob's "**".
+    Symlinked directories are followed (each real directory is walked once, so
+    symlink loops terminate); directories whose name ends with suffix are walked,
+    not returned.
+    """
+    stack = [root]
+    root_stat = os.stat(root)
+    visited = {(root_stat.st_dev, root_stat.st_ino)}
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        target = entry.stat()
+                        if (target.st_dev, target.st_ino) in visited:
+                            continue
+                        visited.add((target.st_dev, target.st_ino))
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield entry.path
+
+
 class LocalParquetWriter(ParquetStoragePort):
     """
     Local filesystem Parquet storage implementation.
@@ -29,7 +58,9 @@ class LocalParquetWriter(ParquetStoragePort):
     def __init__(
         self,
         root_dir: str | Path,
-        default_compression: str = "snappy",
+        default_compression: str = "zstd",
+        default_compression_level: Optional[int] = 3,
+        row_group_size: int = 65_536,
         region: str | None = None,
     ):
         """
@@ -38,6 +69,9 @@ class LocalParquetWriter(ParquetStoragePort):
         Args:
             root_dir: Root directory for all Parquet files.
             default_compression: Default compression codec (snappy, gzip, zstd, none).
+            default_compression_level: Default level for codecs that support one (zstd, gzip).
+            row_group_size: Maximum rows per Parquet row group (smaller groups let readers
+                            parallelize and skip groups using column statistics).
             region: Optional region name to use as root directory prefix.
 
         Raises:
@@ -49,6 +83,8 @@ class LocalParquetWriter(ParquetStoragePort):
         else:
             self._root_dir = base_dir
         self._default_compression = default_compression
+        self._default_compression_level = default_compression_level
+        self._row_group_size = row_group_size
 
         self._validate_directory()
 
@@ -63,13 +99,9 @@ class LocalParquetWriter(ParquetStoragePort):
         if not self._root_dir.is_dir():
             raise StorageError(f"Path is not a directory: {self._root_dir}")
 
-        # Test write permission
-        test_file = self._root_dir / ".write_test"
-        try:
-            test_file.touch()
-            test_file.unlink()
-        except OSError as e:
-            raise StorageError(f"Directory is not writable: {self._root_dir}: {e}")
+        # Check write permission without creating a probe file
+        if not os.access(self._root_dir, os.W_OK | os.X_OK):
+            raise StorageError(f"Directory is not writable: {self._root_dir}")
 
     @property
     def base_path(self) -> str:
@@ -78,21 +110,23 @@ class LocalParquetWriter(ParquetStoragePort):
 
     def write(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         path: str,
         schema: Optional[pa.Schema] = None,
         partition_cols: Optional[list[str]] = None,
-        compression: str = "snappy",
+        compression: Optional[str] = None,
+        use_dictionary: bool | list[str] = True,
     ) -> str:
         """
-        Write a DataFrame to a Parquet file or partitioned dataset.
+        Write a DataFrame or Arrow Table to a Parquet file or partitioned dataset.
 
         Args:
-            df: The DataFrame to write.
+            df: The DataFrame or Arrow Table to write.
             path: Relative path from base_path.
             schema: Optional PyArrow schema.
             partition_cols: Optional list of partition columns.
             compression: Compression codec.
+            use_dictionary: Dictionary-encode all columns (True), none (False) or only the listed ones.
 
         Returns:
             Full path where data was written.
@@ -109,6 +143,18 @@ class LocalParquetWriter(ParquetStoragePort):
                 compression=compression,
             )
 
+        if isinstance(df, pd.DataFrame):
+            # Convert and write one row group at a time rather than building a
+            # full Arrow copy of the DataFrame first
+            schema = schema or pa.Schema.from_pandas(df, preserve_index=False)
+            return self.write_batches(
+                batches=self._dataframe_batches(df, schema, self._row_group_size),
+                path=path,
+                schema=schema,
+                compression=compression,
+                use_dictionary=use_dictionary,
+            )
+
         full_path = self._root_dir / path
         compression = compression or self._default_compression
 
@@ -116,17 +162,16 @@ class LocalParquetWriter(ParquetStoragePort):
             # Ensure parent directory exists
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert DataFrame to PyArrow Table
-            if schema:
-                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-            else:
-                table = pa.Table.from_pandas(df, preserve_index=False)
+            # Cast to the schema if needed (no-op for matching Tables)
+            table = self._to_table(df, schema)
 
             # Write Parquet file
             pq.write_table(
                 table,
                 full_path,
-                compression=compression if compression != "none" else None,
+                **self._compression_options(compression, self._default_compression_level),
+                row_group_size=self._row_group_size,
+                use_dictionary=use_dictionary,
             )
 
             return str(full_path)
@@ -136,18 +181,18 @@ class LocalParquetWriter(ParquetStoragePort):
 
     def write_dataset(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         path: str,
         partition_cols: list[str],
         schema: Optional[pa.Schema] = None,
-        compression: str = "snappy",
+        compression: Optional[str] = None,
         existing_data_behavior: str = "overwrite_or_ignore",
     ) -> str:
         """
-        Write a DataFrame as a partitioned Parquet dataset.
+        Write a DataFrame or Arrow Table as a partitioned Parquet dataset.
 
         Args:
-            df: The DataFrame to write.
+            df: The DataFrame or Arrow Table to write.
             path: Relative path for dataset root.
             partition_cols: Column names to partition by.
             schema: Optional PyArrow schema.
@@ -167,18 +212,17 @@ class LocalParquetWriter(ParquetStoragePort):
             # Ensure directory exists
             full_path.mkdir(parents=True, exist_ok=True)
 
-            # Convert DataFrame to PyArrow Table
-            if schema:
-                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-            else:
-                table = pa.Table.from_pandas(df, preserve_index=False)
+            # Convert to a PyArrow Table, grouped by partition so each
+            # partition file gets contiguous rows (few large row groups)
+            table = self._to_table(df, schema).sort_by([(col, "ascending") for col in partition_cols])
 
             # Write partitioned dataset
             pq.write_to_dataset(
                 table,
                 root_path=str(full_path),
                 partition_cols=partition_cols,
-                compression=compression if compression != "none" else None,
+                **self._compression_options(compression, self._default_compression_level),
+                max_rows_per_group=self._row_group_size,
                 existing_data_behavior=existing_data_behavior,
             )
 
@@ -187,6 +231,54 @@ class LocalParquetWriter(ParquetStoragePort):
         except Exception as e:
             raise StorageError(f"Failed to write partitioned dataset {full_path}: {e}")
 
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        path: str,
+        schema: pa.Schema,
+        compression: Optional[str] = None,
+        use_dictionary: bool | list[str] = True,
+    ) -> str:
+        """
+        Stream RecordBatches into a single Parquet file, one row group per batch.
+
+        Args:
+            batches: RecordBatches to write, all matching schema.
+            path: Relative path from base_path.
+            schema: PyArrow schema of the file.
+            compression: Compression codec.
+            use_dictionary: Dictionary-encode all columns (True), none (False) or only the listed ones.
+
+        Returns:
+            Full path where data was written.
+
+        Raises:
+            StorageError: If write fails.
+        """
+        full_path = self._root_dir / path
+        compression = compression or self._default_compression
+
+        try:
+            # Ensure parent directory exists
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write each batch as its own row group
+            with pq.ParquetWriter(
+                full_path,
+                schema,
+                **self._compression_options(compression, self._default_compression_level),
+                use_dictionary=use_dictionary,
+            ) as writer:
+                for batch in batches:
+                    writer.write_batch(batch, row_group_size=self._row_group_size)
+
+            return str(full_path)
+
+        except Exception as e:
+            # Don't leave a truncated file behind
+            full_path.unlink(missing_ok=True)
+            raise StorageError(f"Failed to write Parquet file {full_path}: {e}")
+
     def exists(self, path: str) -> bool:
         """Check if a file or directory exists."""
         full_path = self._root_dir / path
@@ -207,9 +299,14 @@ class LocalParquetWriter(ParquetStoragePort):
         if not full_path.exists():
             return []
 
-        # Use recursive glob
-        glob_pattern = str(full_path / "**" / pattern)
-        matches = glob_module.glob(glob_pattern, recursive=True)
+        suffix = pattern[1:]
+        if pattern.startswith("*") and not glob_module.has_magic(suffix):
+            # Plain "*<suffix>" patterns: walk with scandir, no per-entry fnmatch
+            matches = _walk_files(str(full_path), suffix)
+        else:
+            # Use recursive glob
+            glob_pattern = str(full_path / "**" / pattern)
+            matches = glob_module.glob(glob_pattern, recursive=True)
 
         # Convert to relative paths
         return [str(Path(m).relative_to(self._root_dir)) for m in matches]
@@ -3,12 +3,14 @@ S3 Parquet Writer - Implementation of ParquetStoragePort for AWS S3.
 
 This adapter writes Parquet files to Amazon S3.
 It has NO knowledge of domain-specific data types - it works purely with
-DataFrames and PyArrow schemas.
+DataFrames, Arrow Tables and PyArrow schemas.
 
 Requires boto3 and s3fs for S3 operations with PyArrow.
 """
 
-from typing import Optional
+import contextlib
+import glob as glob_module
+from typing import Iterable, Optional
 
 import pandas as pd
 import pyarrow as pa
@@ -19,11 +21,24 @@ from ports.parquet_storage import ParquetStoragePort, StorageError
 try:
     import boto3
     import s3fs
+    from botocore.config import Config as BotoConfig
 
     S3_AVAILABLE = True
 except ImportError:
     S3_AVAILABLE = False
 
+# botocore client settings shared by the s3fs filesystem and the boto3 client:
+# keep pooled connections alive and back off adaptively when S3 throttles
+BOTOCORE_CONFIG = {
+    "max_pool_connections": 64,
+    "retries": {"max_attempts": 5, "mode": "adaptive"},
+    "tcp_keepalive": True,
+}
+
+# Seconds s3fs keeps directory listings cached (s3fs invalidates the affected
+# entries itself when this filesystem writes or deletes objects)
+LISTINGS_EXPIRY_SECONDS = 300
+
 
 class S3ParquetWriter(ParquetStoragePort):
     """
@@ -40,7 +55,10 @@ class S3ParquetWriter(ParquetStoragePort):
         bucket: str,
         prefix: str = "",
         region: str = "eu-west-1",
-        default_compression: str = "snappy",
+        default_compression: str = "zstd",
+        default_compression_level: Optional[int] = 3,
+        row_group_size: int = 65_536,
+        upload_chunk_size: int = 6 * 1024 * 1024,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         endpoint_url: Optional[str] = None,
@@ -54,6 +72,11 @@ class S3ParquetWriter(ParquetStoragePort):
             prefix: Optional prefix (folder) within the bucket.
             region: AWS region.
             default_compression: Default compression codec.
+            default_compression_level: Default level for codecs that support one (zstd, gzip).
+            row_group_size: Maximum rows per Parquet row group (smaller groups let readers
+                            parallelize and skip groups using column statistics).
+            upload_chunk_size: Multipart upload part size in bytes; each part is sent as soon
+                               as it is filled, while the rest of the file is still being written.
             aws_access_key_id: Optional AWS access key (uses env/IAM if not provided).
             aws_secret_access_key: Optional AWS secret key.
             endpoint_url: Optional custom endpoint (for S3-compatible storage like MinIO).
@@ -71,12 +94,23 @@ class S3ParquetWriter(ParquetStoragePort):
             self._prefix = f"{base_prefix}/{api_region}" if base_prefix else api_region
         else:
             self._prefix = base_prefix
+        # "bucket/prefix/" prepended to every relative path
+        self._path_prefix = f"{bucket}/{self._prefix}/" if self._prefix else f"{bucket}/"
         self._region = region
         self._default_compression = default_compression
+        self._default_compression_level = default_compression_level
+        self._row_group_size = row_group_size
         self._endpoint_url = endpoint_url
 
         # Initialize S3 filesystem
-        fs_kwargs = {"anon": False}
+        # Listings are cached for a few minutes so repeated exists()/list_files()
+        # calls on the same prefixes are answered without another request
+        fs_kwargs = {
+            "anon": False,
+            "default_block_size": upload_chunk_size,
+            "listings_expiry_time": LISTINGS_EXPIRY_SECONDS,
+            "config_kwargs": BOTOCORE_CONFIG,
+        }
         if aws_access_key_id and aws_secret_access_key:
             fs_kwargs["key"] = aws_access_key_id
             fs_kwargs["secret"] = aws_secret_access_key
@@ -93,7 +127,7 @@ class S3ParquetWriter(ParquetStoragePort):
         if endpoint_url:
             client_kwargs["endpoint_url"] = endpoint_url
 
-        self._s3_client = boto3.client("s3", **client_kwargs)
+        self._s3_client = boto3.client("s3", config=BotoConfig(**BOTOCORE_CONFIG), **client_kwargs)
 
         # Validate bucket access
         self._validate_bucket()
@@ -114,11 +148,7 @@ class S3ParquetWriter(ParquetStoragePort):
 
     def _full_s3_path(self, relative_path: str) -> str:
         """Convert relative path to full S3 path (without s3:// prefix)."""
-        parts = [self._bucket]
-        if self._prefix:
-            parts.append(self._prefix)
-        parts.append(relative_path.lstrip("/"))
-        return "/".join(parts)
+        return self._path_prefix + relative_path.lstrip("/")
 
     def _full_s3_uri(self, relative_path: str) -> str:
         """Convert relative path to full S3 URI."""
@@ -126,21 +156,23 @@ class S3ParquetWriter(ParquetStoragePort):
 
     def write(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         path: str,
         schema: Optional[pa.Schema] = None,
         partition_cols: Optional[list[str]] = None,
-        compression: str = "snappy",
+        compression: Optional[str] = None,
+        use_dictionary: bool | list[str] = True,
     ) -> str:
         """
-        Write a DataFrame to a Parquet file on S3.
+        Write a DataFrame or Arrow Table to a Parquet file on S3.
 
         Args:
-            df: The DataFrame to write.
+            df: The DataFrame or Arrow Table to write.
             path: Relative path from base_path.
             schema: Optional PyArrow schema.
             partition_cols: Optional list of partition columns.
             compression: Compression codec.
+            use_dictionary: Dictionary-encode all columns (True), none (False) or only the listed ones.
 
         Returns:
             Full S3 URI where data was written.
@@ -157,22 +189,33 @@ class S3ParquetWriter(ParquetStoragePort):
                 compression=compression,
             )
 
+        if isinstance(df, pd.DataFrame):
+            # Convert and write one row group at a time rather than building a
+            # full Arrow copy of the DataFrame first
+            schema = schema or pa.Schema.from_pandas(df, preserve_index=False)
+            return self.write_batches(
+                batches=self._dataframe_batches(df, schema, self._row_group_size),
+                path=path,
+                schema=schema,
+                compression=compression,
+                use_dictionary=use_dictionary,
+            )
+
         s3_uri = self._full_s3_uri(path)
         compression = compression or self._default_compression
 
         try:
-            # Convert DataFrame to PyArrow Table
-            if schema:
-                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-            else:
-                table = pa.Table.from_pandas(df, preserve_index=False)
+            # Cast to the schema if needed (no-op for matching Tables)
+            table = self._to_table(df, schema)
 
             # Write Parquet file to S3
             with self._fs.open(self._full_s3_path(path), "wb") as f:
                 pq.write_table(
                     table,
                     f,
-                    compression=compression if compression != "none" else None,
+                    **self._compression_options(compression, self._default_compression_level),
+                    row_group_size=self._row_group_size,
+                    use_dictionary=use_dictionary,
                 )
 
             return s3_uri
@@ -182,18 +225,18 @@ class S3ParquetWriter(ParquetStoragePort):
 
     def write_dataset(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         path: str,
         partition_cols: list[str],
         schema: Optional[pa.Schema] = None,
-        compression: str = "snappy",
+        compression: Optional[str] = None,
         existing_data_behavior: str = "overwrite_or_ignore",
     ) -> str:
         """
-        Write a DataFrame as a partitioned Parquet dataset to S3.
+        Write a DataFrame or Arrow Table as a partitioned Parquet dataset to S3.
 
         Args:
-            df: The DataFrame to write.
+            df: The DataFrame or Arrow Table to write.
             path: Relative path for dataset root.
             partition_cols: Column names to partition by.
             schema: Optional PyArrow schema.
@@ -210,18 +253,17 @@ class S3ParquetWriter(ParquetStoragePort):
         compression = compression or self._default_compression
 
         try:
-            # Convert DataFrame to PyArrow Table
-            if schema:
-                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-            else:
-                table = pa.Table.from_pandas(df, preserve_index=False)
+            # Convert to a PyArrow Table, grouped by partition so each
+            # partition file gets contiguous rows (few large row groups)
+            table = self._to_table(df, schema).sort_by([(col, "ascending") for col in partition_cols])
 
             # Write partitioned dataset to S3
             pq.write_to_dataset(
                 table,
                 root_path=s3_uri,
                 partition_cols=partition_cols,
-                compression=compression if compression != "none" else None,
+                **self._compression_options(compression, self._default_compression_level),
+                max_rows_per_group=self._row_group_size,
                 existing_data_behavior=existing_data_behavior,
                 filesystem=self._fs,
             )
@@ -231,6 +273,58 @@ class S3ParquetWriter(ParquetStoragePort):
         except Exception as e:
             raise StorageError(f"Failed to write partitioned dataset to S3 {s3_uri}: {e}")
 
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        path: str,
+        schema: pa.Schema,
+        compression: Optional[str] = None,
+        use_dictionary: bool | list[str] = True,
+    ) -> str:
+        """
+        Stream RecordBatches into a single Parquet file on S3, one row group per batch.
+
+        Args:
+            batches: RecordBatches to write, all matching schema.
+            path: Relative path from base_path.
+            schema: PyArrow schema of the file.
+            compression: Compression codec.
+            use_dictionary: Dictionary-encode all columns (True), none (False) or only the listed ones.
+
+        Returns:
+            Full S3 URI where data was written.
+
+        Raises:
+            StorageError: If write fails.
+        """
+        s3_uri = self._full_s3_uri(path)
+        s3_path = self._full_s3_path(path)
+        compression = compression or self._default_compression
+        opened = False
+
+        try:
+            # Write each batch as its own row group. The object is committed to S3
+            # when the file is closed, which also happens when an error escapes
+            with self._fs.open(s3_path, "wb") as f:
+                opened = True
+                with pq.ParquetWriter(
+                    f,
+                    schema,
+                    **self._compression_options(compression, self._default_compression_level),
+                    use_dictionary=use_dictionary,
+                ) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch, row_group_size=self._row_group_size)
+
+            return s3_uri
+
+        except Exception as e:
+            if opened:
+                # Don't leave a truncated (but valid-looking) object behind
+                with contextlib.suppress(Exception):
+                    self._fs.rm(s3_path)
+            raise StorageError(f"Failed to write Parquet file to S3 {s3_uri}: {e}")
+
     def exists(self, path: str) -> bool:
         """Check if a file or directory exists on S3."""
         s3_path = self._full_s3_path(path)
@@ -249,17 +343,21 @@ class S3ParquetWriter(ParquetStoragePort):
         """
         s3_path = self._full_s3_path(path)
 
-        if not self._fs.exists(s3_path):
-            return []
-
+        # No exists() pre-check: listing a missing prefix simply finds nothing,
+        # so it would only cost an extra HEAD/LIST round-trip
         try:
-            # s3fs glob pattern
-            glob_pattern = f"{s3_path}/**/{pattern}"
-            matches = self._fs.glob(glob_pattern)
+            suffix = pattern[1:]
+            if pattern.startswith("*") and "/" not in suffix and not glob_module.has_magic(suffix):
+                # Plain "*<suffix>" patterns: one recursive listing and a suffix check
+                matches = [key for key in self._fs.find(s3_path) if key.endswith(suffix)]
+            else:
+                # s3fs glob pattern
+                glob_pattern = f"{s3_path}/**/{pattern}"
+                matches = self._fs.glob(glob_pattern)
 
-            # Convert to relative paths
-            base = self._full_s3_path("")
-            return [m.replace(base, "").lstrip("/") for m in matches]
+            # Convert to relative paths (strip the bucket/prefix from the front only)
+            base_len = len(self._full_s3_path(""))
+            return [m[base_len:].lstrip("/") for m in matches]
 
         except Exception:
             return []
@@ -276,12 +374,12 @@ class S3ParquetWriter(ParquetStoragePort):
         """
         s3_path = self._full_s3_path(path)
 
-        if not self._fs.exists(s3_path):
-            return False
-
         try:
-            # s3fs handles both files and directories
+            # s3fs handles both files and directories, and raises for a missing
+            # path (one request fewer than checking exists() first)
             self._fs.rm(s3_path, recursive=True)
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             raise StorageError(f"Failed to delete S3 path {s3_path}: {e}")
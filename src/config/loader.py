@@ -18,6 +18,7 @@ Example environment variables:
 
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field, SecretStr, field_validator, model_validator
@@ -39,6 +40,18 @@ class BlizzardAPIRegion(str, Enum):
     CN = "cn"
 
 
+# Default API base URL of each region
+REGION_BASE_URLS = MappingProxyType(
+    {
+        BlizzardAPIRegion.EU: "https://eu.api.blizzard.com",
+        BlizzardAPIRegion.US: "https://us.api.blizzard.com",
+        BlizzardAPIRegion.KR: "https://kr.api.blizzard.com",
+        BlizzardAPIRegion.TW: "https://tw.api.blizzard.com",
+        BlizzardAPIRegion.CN: "https://gateway.battlenet.com.cn",
+    }
+)
+
+
 class StorageType(str, Enum):
     """Storage backend types."""
 
@@ -72,15 +85,8 @@ class BlizzardConfig(BaseModel):
     @model_validator(mode="after")
     def update_base_url_for_region(self) -> "BlizzardConfig":
         """Update base URL based on region if using default."""
-        region_urls = {
-            BlizzardAPIRegion.EU: "https://eu.api.blizzard.com",
-            BlizzardAPIRegion.US: "https://us.api.blizzard.com",
-            BlizzardAPIRegion.KR: "https://kr.api.blizzard.com",
-            BlizzardAPIRegion.TW: "https://tw.api.blizzard.com",
-            BlizzardAPIRegion.CN: "https://gateway.battlenet.com.cn",
-        }
-        if self.api_base_url == "https://eu.api.blizzard.com":
-            self.api_base_url = region_urls.get(self.api_region, self.api_base_url)
+        if self.api_base_url == REGION_BASE_URLS[BlizzardAPIRegion.EU]:
+            self.api_base_url = REGION_BASE_URLS.get(self.api_region, self.api_base_url)
         return self
 
 
@@ -92,9 +98,13 @@ class LocalStorageConfig(BaseModel):
         description="Root directory for local Parquet files",
     )
     compression: str = Field(
-        default="snappy",
+        default="zstd",
         description="Compression codec (snappy, gzip, zstd, none)",
     )
+    compression_level: Optional[int] = Field(
+        default=3,
+        description="Compression level for codecs that support one (zstd, gzip)",
+    )
 
     @field_validator("root_directory", mode="before")
     @classmethod
@@ -112,9 +122,18 @@ class S3StorageConfig(BaseModel):
     prefix: str = Field(default="", description="S3 key prefix (folder)")
     region: str = Field(default="eu-west-1", description="AWS region")
     compression: str = Field(
-        default="snappy",
+        default="zstd",
         description="Compression codec (snappy, gzip, zstd, none)",
     )
+    compression_level: Optional[int] = Field(
+        default=3,
+        description="Compression level for codecs that support one (zstd, gzip)",
+    )
+    upload_chunk_size: int = Field(
+        default=6 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Multipart upload part size in bytes (S3 minimum is 5 MiB)",
+    )
     endpoint_url: Optional[str] = Field(
         default=None,
         description="Custom S3 endpoint (for MinIO, LocalStack, etc.)",
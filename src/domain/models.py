@@ -35,7 +35,7 @@ class PopulationType(Enum):
     RECOMMENDED = "RECOMMENDED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectedRealm:
     """
     A connected realm grouping in World of Warcraft.
@@ -79,7 +79,7 @@ class RealmDetails:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuctionItem:
     """
     An item listed in an auction.
@@ -88,11 +88,11 @@ class AuctionItem:
     """
 
     id: int
-    bonus_lists: tuple[int, ...] = field(default_factory=tuple)
-    modifiers: tuple[tuple[int, int], ...] = field(default_factory=tuple)
+    bonus_lists: tuple[int, ...] = ()
+    modifiers: tuple[tuple[int, int], ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Auction:
     """
     A single auction listing.
@@ -127,7 +127,7 @@ class AuctionData:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Item:
     """
     A World of Warcraft item.
@@ -150,7 +150,7 @@ class Item:
     description: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemMedia:
     """Media assets for an item (icon, etc.)."""
 
@@ -163,7 +163,7 @@ class ItemMedia:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecipeReagent:
     """A reagent required for crafting a recipe."""
 
@@ -172,7 +172,7 @@ class RecipeReagent:
     quantity: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recipe:
     """
     A crafting recipe.
@@ -186,10 +186,10 @@ class Recipe:
     crafted_item_name: Optional[str]
     crafted_quantity_min: int
     crafted_quantity_max: int
-    reagents: tuple[RecipeReagent, ...] = field(default_factory=tuple)
+    reagents: tuple[RecipeReagent, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Profession:
     """
     A crafting or gathering profession.
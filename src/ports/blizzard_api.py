@@ -8,7 +8,7 @@ and transformation of raw API responses into domain models.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from domain.models import (
     AuctionData,
@@ -73,13 +73,14 @@ class BlizzardAPIPort(ABC):
         pass
 
     @abstractmethod
-    async def get_all_connected_realms(self, realm_ids: Optional[list[int]] = None, max_concurrent: int = 10) -> dict[int, ConnectedRealm]:
+    async def get_all_connected_realms(self, realm_ids: Optional[list[int]] = None, max_concurrent: Optional[int] = None) -> dict[int, ConnectedRealm]:
         """
         Fetch details for multiple connected realms concurrently.
 
         Args:
             realm_ids: List of realm IDs to fetch. If None, fetches all realms.
             max_concurrent: Maximum number of concurrent requests.
+                           If None, only the adapter-wide request limit applies.
 
         Returns:
             Dictionary mapping realm_id to ConnectedRealm.
@@ -117,19 +118,38 @@ class BlizzardAPIPort(ABC):
         pass
 
     @abstractmethod
-    async def get_multiple_realm_auctions(self, realm_ids: list[int], max_concurrent: int = 5) -> dict[int, AuctionData]:
+    async def get_multiple_realm_auctions(self, realm_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, AuctionData]:
         """
         Fetch auctions from multiple realms concurrently.
 
         Args:
             realm_ids: List of realm IDs to fetch auctions from.
             max_concurrent: Maximum number of concurrent requests.
+                           If None, only the adapter-wide request limit applies.
 
         Returns:
             Dictionary mapping realm_id to AuctionData.
         """
         pass
 
+    @abstractmethod
+    def iter_realm_auctions(self, realm_ids: list[int], max_concurrent: Optional[int] = None) -> AsyncIterator[tuple[int, AuctionData]]:
+        """
+        Fetch auctions from multiple realms concurrently, yielding each realm as it completes.
+
+        Prefer this over get_multiple_realm_auctions for large scans: only the
+        realms currently in flight are held in memory, instead of all of them.
+
+        Args:
+            realm_ids: List of realm IDs to fetch auctions from.
+            max_concurrent: Maximum number of realms fetched at the same time.
+                           If None, the adapter's default realm scan concurrency applies.
+
+        Yields:
+            Tuples of (realm_id, AuctionData), in completion order.
+        """
+        pass
+
     # =========================================================================
     # Item Methods
     # =========================================================================
@@ -160,6 +180,36 @@ class BlizzardAPIPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_items(self, item_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, Item]:
+        """
+        Fetch details for multiple items concurrently.
+
+        Args:
+            item_ids: List of item IDs to fetch (duplicates are fetched once).
+            max_concurrent: Maximum number of concurrent requests.
+                           If None, only the adapter-wide request limit applies.
+
+        Returns:
+            Dictionary mapping item_id to Item, omitting items that were not found.
+        """
+        pass
+
+    @abstractmethod
+    async def get_items_media(self, item_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, ItemMedia]:
+        """
+        Fetch media (icons) for multiple items concurrently.
+
+        Args:
+            item_ids: List of item IDs to fetch media for (duplicates are fetched once).
+            max_concurrent: Maximum number of concurrent requests.
+                           If None, only the adapter-wide request limit applies.
+
+        Returns:
+            Dictionary mapping item_id to ItemMedia, omitting items that were not found.
+        """
+        pass
+
     @abstractmethod
     async def get_item_classes(self) -> list[dict]:
         """
@@ -190,6 +240,20 @@ class BlizzardAPIPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_search_items(self, name: Optional[str] = None, order_by: str = "id") -> AsyncIterator[dict]:
+        """
+        Iterate over all item search results across every page.
+
+        Args:
+            name: Item name to search for (partial match).
+            order_by: Field to sort results by.
+
+        Yields:
+            Raw search result dictionaries, in page order.
+        """
+        pass
+
     # =========================================================================
     # Recipe/Profession Methods
     # =========================================================================
@@ -217,6 +281,21 @@ class BlizzardAPIPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_recipes(self, recipe_ids: list[int], max_concurrent: Optional[int] = None) -> dict[int, Recipe]:
+        """
+        Fetch details for multiple recipes concurrently.
+
+        Args:
+            recipe_ids: List of recipe IDs to fetch (duplicates are fetched once).
+            max_concurrent: Maximum number of concurrent requests.
+                           If None, only the adapter-wide request limit applies.
+
+        Returns:
+            Dictionary mapping recipe_id to Recipe, omitting recipes that were not found.
+        """
+        pass
+
     @abstractmethod
     async def search_recipes(
         self,
@@ -236,3 +315,17 @@ class BlizzardAPIPort(ABC):
             Raw search results dictionary.
         """
         pass
+
+    @abstractmethod
+    def iter_search_recipes(self, name: Optional[str] = None, order_by: str = "id") -> AsyncIterator[dict]:
+        """
+        Iterate over all recipe search results across every page.
+
+        Args:
+            name: Recipe name to search for (partial match).
+            order_by: Field to sort results by.
+
+        Yields:
+            Raw search result dictionaries, in page order.
+        """
+        pass
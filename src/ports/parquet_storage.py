@@ -4,28 +4,31 @@ Parquet Storage Port - Interface for writing data to Parquet format.
 This port defines a generic contract for Parquet file storage.
 It has NO knowledge of specific domain types (auctions, items, etc.).
 The port works with:
-- pandas DataFrames (the data to write)
+- pandas DataFrames or PyArrow Tables (the data to write)
 - PyArrow schemas (optional explicit schema definition)
 - Partition columns (for directory-based partitioning)
 
 The use case layer is responsible for converting domain models to DataFrames
-before calling this port.
+(or Tables) before calling this port.
 """
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import pandas as pd
 import pyarrow as pa
 
+# Parquet codecs that accept a compression level
+LEVELED_CODECS = frozenset({"zstd", "gzip", "brotli"})
+
 
 class ParquetStoragePort(ABC):
     """
     Abstract interface for Parquet file storage.
 
     This is a generic storage port that:
-    - Accepts DataFrames and writes them as Parquet files
+    - Accepts DataFrames or Arrow Tables and writes them as Parquet files
     - Supports optional PyArrow schemas for type enforcement
     - Supports partitioning by columns
     - Has no knowledge of domain-specific data types
@@ -48,24 +51,30 @@ class ParquetStoragePort(ABC):
     @abstractmethod
     def write(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         path: str,
         schema: Optional[pa.Schema] = None,
         partition_cols: Optional[list[str]] = None,
-        compression: str = "snappy",
+        compression: Optional[str] = None,
+        use_dictionary: bool | list[str] = True,
     ) -> str:
         """
-        Write a DataFrame to a Parquet file or partitioned dataset.
+        Write a DataFrame or Arrow Table to a Parquet file or partitioned dataset.
 
         Args:
-            df: The DataFrame to write.
+            df: The DataFrame or Arrow Table to write (Tables are written without conversion).
             path: Relative path from base_path (e.g., "auctions/data.parquet").
-            schema: Optional PyArrow schema. If provided, the DataFrame will be
+            schema: Optional PyArrow schema. If provided, the data will be
                    converted to match this schema. If None, schema is inferred.
             partition_cols: Optional list of column names to partition by.
                           When provided, writes a partitioned dataset (directory
                           structure) instead of a single file.
             compression: Compression codec (snappy, gzip, zstd, none).
+                        If None, the writer's default codec is used.
+            use_dictionary: Whether to dictionary-encode columns: True for all, False for none,
+                           or a list of column names. Restricting it to low-cardinality
+                           columns avoids building (and discarding) dictionaries for
+                           unique values such as IDs and prices.
 
         Returns:
             The full path/URI where the data was written.
@@ -78,25 +87,25 @@ class ParquetStoragePort(ABC):
     @abstractmethod
     def write_dataset(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         path: str,
         partition_cols: list[str],
         schema: Optional[pa.Schema] = None,
-        compression: str = "snappy",
+        compression: Optional[str] = None,
         existing_data_behavior: str = "overwrite_or_ignore",
     ) -> str:
         """
-        Write a DataFrame as a partitioned Parquet dataset.
+        Write a DataFrame or Arrow Table as a partitioned Parquet dataset.
 
         This is optimized for partitioned writes with options for handling
         existing data.
 
         Args:
-            df: The DataFrame to write.
+            df: The DataFrame or Arrow Table to write.
             path: Relative path from base_path for the dataset root.
             partition_cols: Column names to partition by (required).
             schema: Optional PyArrow schema.
-            compression: Compression codec.
+            compression: Compression codec (None uses the writer's default).
             existing_data_behavior: How to handle existing partitions:
                 - "overwrite_or_ignore": Overwrite existing files, ignore others
                 - "error": Raise error if any partition exists
@@ -107,6 +116,40 @@ class ParquetStoragePort(ABC):
         """
         pass
 
+    @abstractmethod
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        path: str,
+        schema: pa.Schema,
+        compression: Optional[str] = None,
+        use_dictionary: bool | list[str] = True,
+    ) -> str:
+        """
+        Stream RecordBatches into a single Parquet file, one row group per batch.
+
+        Batches are written as they are produced, so the full dataset never
+        needs to be materialized as one table.
+
+        Args:
+            batches: RecordBatches to write, all matching schema.
+            path: Relative path from base_path (e.g., "auctions/data.parquet").
+            schema: PyArrow schema of the file.
+            compression: Compression codec (snappy, gzip, zstd, none).
+                        If None, the writer's default codec is used.
+            use_dictionary: Whether to dictionary-encode columns: True for all, False for none,
+                           or a list of column names. Restricting it to low-cardinality
+                           columns avoids building (and discarding) dictionaries for
+                           unique values such as IDs and prices.
+
+        Returns:
+            The full path/URI where the data was written.
+
+        Raises:
+            StorageError: If the write operation fails.
+        """
+        pass
+
     @abstractmethod
     def exists(self, path: str) -> bool:
         """
@@ -147,6 +190,47 @@ class ParquetStoragePort(ABC):
         """
         pass
 
+    @staticmethod
+    def _compression_options(compression: str, compression_level: Optional[int] = None) -> dict:
+        """
+        Build the PyArrow Parquet compression keyword arguments for a codec.
+
+        The level is only passed to codecs that accept one; PyArrow rejects it
+        for snappy and uncompressed files. Codec names are case-insensitive, as in PyArrow.
+        """
+        codec = compression.lower()
+        if codec == "none":
+            codec = None
+        options = {"compression": codec}
+        if compression_level is not None and codec in LEVELED_CODECS:
+            options["compression_level"] = compression_level
+        return options
+
+    @staticmethod
+    def _to_table(df: pd.DataFrame | pa.Table, schema: Optional[pa.Schema] = None) -> pa.Table:
+        """
+        Convert the data to write into a PyArrow Table.
+
+        Tables are passed through untouched (cast only if they don't match the
+        schema), so callers that build Arrow data directly skip the pandas copy.
+        """
+        if isinstance(df, pa.Table):
+            if schema is None or df.schema.equals(schema):
+                return df
+            return df.cast(schema)
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+    @staticmethod
+    def _dataframe_batches(df: pd.DataFrame, schema: pa.Schema, batch_size: int) -> Iterator[pa.RecordBatch]:
+        """
+        Convert a DataFrame to RecordBatches one slice at a time.
+
+        Only one slice is held as Arrow data at once, instead of a full Table
+        copy of the DataFrame, which bounds peak memory while writing.
+        """
+        for start in range(0, len(df), batch_size):
+            yield pa.RecordBatch.from_pandas(df.iloc[start : start + batch_size], schema=schema, preserve_index=False)
+
     def full_path(self, relative_path: str) -> str:
         """
         Convert a relative path to a full path/URI.
@@ -2,16 +2,22 @@
 
 from usecases.fetch_and_store_auctions import FetchAndStoreAuctionsUseCase
 from usecases.data_transformers import (
+    auction_record_batches,
     auctions_to_dataframe,
+    auctions_to_table,
     connected_realms_to_dataframe,
+    connected_realms_to_table,
     AUCTION_SCHEMA,
     CONNECTED_REALM_SCHEMA,
 )
 
 __all__ = [
     "FetchAndStoreAuctionsUseCase",
+    "auction_record_batches",
     "auctions_to_dataframe",
+    "auctions_to_table",
     "connected_realms_to_dataframe",
+    "connected_realms_to_table",
     "AUCTION_SCHEMA",
     "CONNECTED_REALM_SCHEMA",
 ]
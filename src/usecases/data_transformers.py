@@ -13,10 +13,11 @@ The schemas defined here are optimized for Parquet storage and querying.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from domain.models import AuctionData, ConnectedRealm
 
@@ -29,13 +30,13 @@ AUCTION_SCHEMA = pa.schema(
     [
         ("auction_id", pa.int64()),
         ("item_id", pa.int32()),
-        ("quantity", pa.int16()),
+        ("quantity", pa.int32()),
         ("time_left", pa.dictionary(pa.int8(), pa.string())),
         ("unit_price", pa.int64()),
         ("buyout", pa.int64()),
         ("bid", pa.int64()),
-        ("bonus_lists", pa.string()),  # JSON-encoded list
-        ("modifiers", pa.string()),  # JSON-encoded list of tuples
+        ("bonus_lists", pa.list_(pa.int32())),
+        ("modifiers", pa.map_(pa.int32(), pa.int64())),  # modifier type -> value
         ("connected_realm_id", pa.int32()),
         ("fetch_timestamp", pa.timestamp("us", tz="UTC")),
         # Partition columns
@@ -55,6 +56,52 @@ CONNECTED_REALM_SCHEMA = pa.schema(
     ]
 )
 
+# Possible auction durations, shortest first ("UNKNOWN" is the parser's fallback).
+# A fixed dictionary keeps time_left codes identical across every written file.
+TIME_LEFT_VALUES = ("SHORT", "MEDIUM", "LONG", "VERY_LONG", "UNKNOWN")
+TIME_LEFT_DICTIONARY = pa.array(TIME_LEFT_VALUES, type=pa.string())
+
+# pandas dtypes matching the schemas above (prices are nullable)
+AUCTION_DTYPES = {
+    "auction_id": "int64",
+    "item_id": "int32",
+    "quantity": "int32",
+    "connected_realm_id": "int32",
+    "unit_price": "Int64",
+    "buyout": "Int64",
+    "bid": "Int64",
+    "time_left": "category",
+}
+
+REALM_DTYPES = {
+    "id": "int32",
+    "status": "category",
+    "population": "category",
+    "has_queue": "bool",
+}
+
+# Rows per RecordBatch (and Parquet row group) when streaming auctions to storage
+AUCTION_BATCH_SIZE = 65_536
+
+# Parquet leaf columns written with dictionary encoding. auction_id is unique per
+# row, so building (and then discarding) a dictionary for it only costs time and space.
+# item_id stays: a realm lists many auctions per item (~15k distinct IDs in 300k rows).
+AUCTION_DICTIONARY_COLUMNS = [
+    "item_id",
+    "quantity",
+    "time_left",
+    "unit_price",
+    "buyout",
+    "bid",
+    "bonus_lists.list.element",
+    "modifiers.key_value.key",
+    "modifiers.key_value.value",
+    "connected_realm_id",
+    "fetch_timestamp",
+    "date",
+    "hour",
+]
+
 
 # =============================================================================
 # Transformer Functions
@@ -75,31 +122,33 @@ def auctions_to_dataframe(
     Returns:
         DataFrame with flattened auction records.
     """
-    records = []
+    auctions = auction_data.auctions
     timestamp = auction_data.fetch_timestamp
 
-    for auction in auction_data.auctions:
-        record = {
-            "auction_id": auction.id,
-            "item_id": auction.item.id,
-            "quantity": auction.quantity,
-            "time_left": auction.time_left,
-            "unit_price": auction.unit_price,
-            "buyout": auction.buyout,
-            "bid": auction.bid,
-            "bonus_lists": str(list(auction.item.bonus_lists)) if auction.item.bonus_lists else "[]",
-            "modifiers": str(list(auction.item.modifiers)) if auction.item.modifiers else "[]",
-            "connected_realm_id": auction_data.connected_realm_id,
-            "fetch_timestamp": timestamp,
-        }
-
-        if include_partition_cols:
-            record["date"] = timestamp.strftime("%Y-%m-%d")
-            record["hour"] = timestamp.strftime("%H")
-
-        records.append(record)
-
-    df = pd.DataFrame(records)
+    if not auctions:
+        return pd.DataFrame()
+
+    # Build one list per column (struct-of-arrays) instead of one dict per auction;
+    # values shared by the whole batch are broadcast by pandas.
+    columns = {
+        "auction_id": [auction.id for auction in auctions],
+        "item_id": [auction.item.id for auction in auctions],
+        "quantity": [auction.quantity for auction in auctions],
+        "time_left": _time_left_array([auction.time_left for auction in auctions]).to_pandas(),
+        "unit_price": [auction.unit_price for auction in auctions],
+        "buyout": [auction.buyout for auction in auctions],
+        "bid": [auction.bid for auction in auctions],
+        "bonus_lists": [auction.item.bonus_lists for auction in auctions],
+        "modifiers": [auction.item.modifiers for auction in auctions],
+        "connected_realm_id": auction_data.connected_realm_id,
+        "fetch_timestamp": timestamp,
+    }
+
+    if include_partition_cols:
+        columns["date"] = timestamp.strftime("%Y-%m-%d")
+        columns["hour"] = timestamp.strftime("%H")
+
+    df = pd.DataFrame(columns)
 
     # Optimize dtypes
     if len(df) > 0:
@@ -108,6 +157,82 @@ def auctions_to_dataframe(
     return df
 
 
+def auction_record_batches(
+    auction_data: AuctionData,
+    batch_size: int = AUCTION_BATCH_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Convert AuctionData domain model to PyArrow RecordBatches, one slice at a time.
+
+    Only one batch worth of intermediate Python column lists exists at any time,
+    so the batches can be streamed to a Parquet writer row group by row group.
+
+    Args:
+        auction_data: The auction data to convert.
+        batch_size: Maximum number of rows per batch.
+
+    Yields:
+        RecordBatches matching AUCTION_SCHEMA (including partition columns).
+    """
+    auctions = auction_data.auctions
+    timestamp = auction_data.fetch_timestamp
+    date_str = timestamp.strftime("%Y-%m-%d")
+    hour_str = timestamp.strftime("%H")
+
+    for start in range(0, len(auctions), batch_size):
+        chunk = auctions[start : start + batch_size]
+        n = len(chunk)
+        columns = {
+            "auction_id": [auction.id for auction in chunk],
+            "item_id": [auction.item.id for auction in chunk],
+            "quantity": [auction.quantity for auction in chunk],
+            "time_left": _time_left_array([auction.time_left for auction in chunk]),
+            "unit_price": [auction.unit_price for auction in chunk],
+            "buyout": [auction.buyout for auction in chunk],
+            "bid": [auction.bid for auction in chunk],
+            "bonus_lists": [auction.item.bonus_lists for auction in chunk],
+            "modifiers": [auction.item.modifiers for auction in chunk],
+            "connected_realm_id": [auction_data.connected_realm_id] * n,
+            "fetch_timestamp": [timestamp] * n,
+            "date": [date_str] * n,
+            "hour": [hour_str] * n,
+        }
+        yield pa.RecordBatch.from_pydict(columns, schema=AUCTION_SCHEMA)
+
+
+def auctions_to_table(auction_data: AuctionData) -> pa.Table:
+    """
+    Convert AuctionData domain model directly to a PyArrow Table.
+
+    Builds the Arrow columns straight from the domain records, skipping the
+    pandas DataFrame (and its conversion copy) when the data is only written
+    to Parquet.
+
+    Args:
+        auction_data: The auction data to convert.
+
+    Returns:
+        Table matching AUCTION_SCHEMA (including partition columns).
+    """
+    return pa.Table.from_batches(auction_record_batches(auction_data), schema=AUCTION_SCHEMA)
+
+
+def _time_left_array(values: list[str]) -> pa.DictionaryArray:
+    """
+    Encode time_left values against the fixed TIME_LEFT_DICTIONARY.
+
+    Only the (at most five) inferred dictionary entries are looked up; row codes
+    are remapped with a take. Falls back to the inferred dictionary if the API
+    returns a value outside the known set, so no value is ever lost.
+    """
+    inferred = pa.array(values, type=AUCTION_SCHEMA.field("time_left").type)
+    positions = pc.index_in(inferred.dictionary, value_set=TIME_LEFT_DICTIONARY)
+    if positions.null_count:
+        return inferred
+    indices = pc.take(positions.cast(pa.int8()), inferred.indices)
+    return pa.DictionaryArray.from_arrays(indices, TIME_LEFT_DICTIONARY)
+
+
 def connected_realms_to_dataframe(realms: dict[int, ConnectedRealm]) -> pd.DataFrame:
     """
     Convert connected realms to a DataFrame.
@@ -118,25 +243,40 @@ def connected_realms_to_dataframe(realms: dict[int, ConnectedRealm]) -> pd.DataF
     Returns:
         DataFrame with realm records.
     """
-    records = []
+    if not realms:
+        return pd.DataFrame()
 
-    for realm_id, realm in realms.items():
-        record = {
-            "id": realm.id,
-            "realm_names": ",".join(realm.realm_names),
-            "realm_slugs": ",".join(realm.realm_slugs),
-            "status": realm.status.value,
-            "population": realm.population.value,
-            "has_queue": realm.has_queue,
-        }
-        records.append(record)
+    # One list per column (struct-of-arrays) instead of one dict per realm
+    return _optimize_realm_dtypes(pd.DataFrame(_connected_realm_columns(realms)))
 
-    df = pd.DataFrame(records)
 
-    if len(df) > 0:
-        df = _optimize_realm_dtypes(df)
+def connected_realms_to_table(realms: dict[int, ConnectedRealm]) -> pa.Table:
+    """
+    Convert connected realms directly to a PyArrow Table.
 
-    return df
+    Builds the columns straight from the domain records, skipping the per-realm
+    dicts and the pandas DataFrame when the data is only written to Parquet.
+
+    Args:
+        realms: Dictionary mapping realm_id to ConnectedRealm.
+
+    Returns:
+        Table matching CONNECTED_REALM_SCHEMA.
+    """
+    return pa.Table.from_pydict(_connected_realm_columns(realms), schema=CONNECTED_REALM_SCHEMA)
+
+
+def _connected_realm_columns(realms: dict[int, ConnectedRealm]) -> dict[str, list]:
+    """Build one list per CONNECTED_REALM_SCHEMA column (struct-of-arrays) from the realms."""
+    values = realms.values()
+    return {
+        "id": [realm.id for realm in values],
+        "realm_names": [",".join(realm.realm_names) for realm in values],
+        "realm_slugs": [",".join(realm.realm_slugs) for realm in values],
+        "status": [realm.status.value for realm in values],
+        "population": [realm.population.value for realm in values],
+        "has_queue": [realm.has_queue for realm in values],
+    }
 
 
 def _optimize_auction_dtypes(df: pd.DataFrame) -> pd.DataFrame:
@@ -145,36 +285,17 @@ def _optimize_auction_dtypes(df: pd.DataFrame) -> pd.DataFrame:
 
     Uses:
     - int64 for auction_id (large values)
-    - int32 for item_id and realm_id
-    - int16 for quantity
+    - int32 for item_id, realm_id and quantity (commodity stacks exceed int16)
     - nullable Int64 for optional price columns
     - category for time_left (small cardinality)
     """
-    # Integer columns
-    df["auction_id"] = df["auction_id"].astype("int64")
-    df["item_id"] = df["item_id"].astype("int32")
-    df["quantity"] = df["quantity"].astype("int16")
-    df["connected_realm_id"] = df["connected_realm_id"].astype("int32")
-
-    # Nullable integer columns (prices can be null)
-    df["unit_price"] = df["unit_price"].astype("Int64")
-    df["buyout"] = df["buyout"].astype("Int64")
-    df["bid"] = df["bid"].astype("Int64")
-
-    # Categorical for low-cardinality string columns
-    df["time_left"] = df["time_left"].astype("category")
-
-    return df
+    # Single astype call: one pass instead of one column rebuild per assignment
+    return df.astype({col: dtype for col, dtype in AUCTION_DTYPES.items() if col in df.columns})
 
 
 def _optimize_realm_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     """Optimize DataFrame column dtypes for realm data."""
-    df["id"] = df["id"].astype("int32")
-    df["status"] = df["status"].astype("category")
-    df["population"] = df["population"].astype("category")
-    df["has_queue"] = df["has_queue"].astype("bool")
-
-    return df
+    return df.astype({col: dtype for col, dtype in REALM_DTYPES.items() if col in df.columns})
 
 
 def generate_auction_path(
@@ -3,7 +3,7 @@ Fetch and Store Auctions Use Case.
 
 This use case orchestrates:
 1. Fetching data from the Blizzard API (via BlizzardAPIPort)
-2. Transforming domain models to DataFrames (via data_transformers)
+2. Transforming domain models to DataFrames/Arrow Tables (via data_transformers)
 3. Storing data as Parquet files (via ParquetStoragePort)
 
 The use case has no knowledge of:
@@ -13,18 +13,20 @@ The use case has no knowledge of:
 It only knows about:
 - Domain models (what data looks like)
 - Ports (interfaces for external operations)
-- Transformers (how to convert domain to DataFrames)
+- Transformers (how to convert domain to DataFrames/Arrow Tables)
 """
 
+import asyncio
 from typing import Optional
 
 from domain.models import AuctionData, ConnectedRealm
 from ports.blizzard_api import BlizzardAPIPort
 from ports.parquet_storage import ParquetStoragePort
 from usecases.data_transformers import (
-    auctions_to_dataframe,
-    connected_realms_to_dataframe,
+    auction_record_batches,
+    connected_realms_to_table,
     generate_auction_path,
+    AUCTION_DICTIONARY_COLUMNS,
     AUCTION_SCHEMA,
     CONNECTED_REALM_SCHEMA,
 )
@@ -73,13 +75,11 @@ class FetchAndStoreAuctionsUseCase:
         # Fetch all realm details
         realms = await self._api.get_all_connected_realms(realm_ids)
 
-        # Transform to DataFrame
-        df = connected_realms_to_dataframe(realms)
-
-        # Store as Parquet
-        if len(df) > 0:
+        # Transform to an Arrow Table (no pandas round-trip) and store as Parquet,
+        # skipping both when there is nothing to write
+        if realms:
             self._storage.write(
-                df=df,
+                df=connected_realms_to_table(realms),
                 path=filename,
                 schema=CONNECTED_REALM_SCHEMA,
             )
@@ -89,14 +89,14 @@ class FetchAndStoreAuctionsUseCase:
     async def fetch_and_store_realm_auctions(
         self,
         realm_ids: Optional[list[int]] = None,
-        max_concurrent: int = 5,
+        max_concurrent: Optional[int] = None,
     ) -> dict[int, str]:
         """
         Fetch auctions for specified realms and store each as a separate Parquet file.
 
         Args:
             realm_ids: List of realm IDs to fetch. If None, fetches all realms.
-            max_concurrent: Maximum concurrent API requests.
+            max_concurrent: Maximum number of realms fetched at once (None uses the API client's default).
 
         Returns:
             Dictionary mapping realm_id to the output file path.
@@ -105,15 +105,13 @@ class FetchAndStoreAuctionsUseCase:
         if realm_ids is None:
             realm_ids = await self._api.get_connected_realm_ids()
 
-        # Fetch auctions for all realms
-        auctions_by_realm = await self._api.get_multiple_realm_auctions(realm_ids, max_concurrent)
-
-        # Store each realm's auctions separately
+        # Store each realm's auctions separately, as soon as the realm is fetched,
+        # so only the realms in flight are held in memory
         result_paths = {}
-        for realm_id, auction_data in auctions_by_realm.items():
+        async for realm_id, auction_data in self._api.iter_realm_auctions(realm_ids, max_concurrent):
             if len(auction_data.auctions) > 0:
-                # Transform to DataFrame
-                df = auctions_to_dataframe(auction_data)
+                # Transform to Arrow RecordBatches lazily (no pandas round-trip)
+                batches = auction_record_batches(auction_data)
 
                 # Generate path
                 path = generate_auction_path(
@@ -121,11 +119,14 @@ class FetchAndStoreAuctionsUseCase:
                     realm_id,
                 )
 
-                # Store as Parquet
-                full_path = self._storage.write(
-                    df=df,
+                # Stream to Parquet, one row group per batch. The write is blocking,
+                # so run it in a thread to keep the other realm downloads progressing
+                full_path = await asyncio.to_thread(
+                    self._storage.write_batches,
+                    batches=batches,
                     path=path,
                     schema=AUCTION_SCHEMA,
+                    use_dictionary=AUCTION_DICTIONARY_COLUMNS,
                 )
                 result_paths[realm_id] = full_path
 
@@ -146,8 +147,8 @@ class FetchAndStoreAuctionsUseCase:
         if len(auction_data.auctions) == 0:
             return None
 
-        # Transform to DataFrame
-        df = auctions_to_dataframe(auction_data)
+        # Transform to Arrow RecordBatches lazily (no pandas round-trip)
+        batches = auction_record_batches(auction_data)
 
         # Generate path (realm_id=0 for commodities)
         path = generate_auction_path(
@@ -155,11 +156,14 @@ class FetchAndStoreAuctionsUseCase:
             realm_id=0,
         )
 
-        # Store as Parquet
-        return self._storage.write(
-            df=df,
+        # Stream to Parquet, one row group per batch. The write is blocking,
+        # so run it in a thread to keep the event loop responsive
+        return await asyncio.to_thread(
+            self._storage.write_batches,
+            batches=batches,
             path=path,
             schema=AUCTION_SCHEMA,
+            use_dictionary=AUCTION_DICTIONARY_COLUMNS,
         )
 
     async def execute(
@@ -168,7 +172,7 @@ class FetchAndStoreAuctionsUseCase:
         include_auctions: bool = True,
         include_commodities: bool = True,
         realm_ids: Optional[list[int]] = None,
-        max_concurrent: int = 5,
+        max_concurrent: Optional[int] = None,
     ) -> dict:
         """
         Execute the full auction data pipeline.
@@ -178,7 +182,7 @@ class FetchAndStoreAuctionsUseCase:
             include_auctions: Whether to fetch and store realm auctions.
             include_commodities: Whether to fetch and store commodity auctions.
             realm_ids: Specific realm IDs to fetch auctions for.
-            max_concurrent: Maximum concurrent API requests.
+            max_concurrent: Maximum number of realms fetched at once (None uses the API client's default).
 
         Returns:
             Dictionary with results for each component:
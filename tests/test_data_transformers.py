@@ -0,0 +1,37 @@
+"""Tests for the auction and realm data transformers."""
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from domain.models import Auction, AuctionData, AuctionItem
+from usecases.data_transformers import AUCTION_SCHEMA, auction_record_batches, auctions_to_dataframe, auctions_to_table
+
+# Commodity stacks routinely exceed the int16 range
+LARGE_QUANTITY = 40_000
+
+
+def _commodity_data() -> AuctionData:
+    return AuctionData(
+        connected_realm_id=0,
+        auctions=[
+            Auction(id=1, item=AuctionItem(id=190396), quantity=LARGE_QUANTITY, time_left="SHORT", unit_price=1500),
+            Auction(id=2, item=AuctionItem(id=190396), quantity=1, time_left="LONG", unit_price=1600),
+        ],
+        fetch_timestamp=datetime(2026, 10, 15, 14, 5, tzinfo=timezone.utc),
+    )
+
+
+def test_record_batches_keep_large_quantities():
+    table = pa.Table.from_batches(auction_record_batches(_commodity_data()), schema=AUCTION_SCHEMA)
+    assert table.column("quantity").to_pylist() == [LARGE_QUANTITY, 1]
+
+
+def test_table_keeps_large_quantities():
+    table = auctions_to_table(_commodity_data())
+    assert table.column("quantity").to_pylist() == [LARGE_QUANTITY, 1]
+
+
+def test_dataframe_keeps_large_quantities():
+    df = auctions_to_dataframe(_commodity_data())
+    assert df["quantity"].tolist() == [LARGE_QUANTITY, 1]
@@ -0,0 +1,40 @@
+"""Tests for the local filesystem Parquet writer."""
+
+import os
+
+from adapters.storage.local_writer import LocalParquetWriter
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+
+
+def test_list_files_walks_partitions(tmp_path):
+    _touch(tmp_path / "auctions" / "2026-10-15" / "14" / "realm_1" / "a.parquet")
+    _touch(tmp_path / "auctions" / "2026-10-15" / "14" / "realm_1" / "notes.txt")
+    _touch(tmp_path / "auctions" / ".hidden" / "b.parquet")
+
+    files = LocalParquetWriter(tmp_path).list_files("auctions")
+
+    assert files == [os.path.join("auctions", "2026-10-15", "14", "realm_1", "a.parquet")]
+
+
+def test_list_files_follows_symlinked_directories(tmp_path):
+    _touch(tmp_path / "archive" / "a.parquet")
+    (tmp_path / "auctions").mkdir()
+    (tmp_path / "auctions" / "archive").symlink_to(tmp_path / "archive", target_is_directory=True)
+    # A loop back to the listed directory must not be walked forever
+    (tmp_path / "auctions" / "loop").symlink_to(tmp_path / "auctions", target_is_directory=True)
+
+    files = LocalParquetWriter(tmp_path).list_files("auctions")
+
+    assert files == [os.path.join("auctions", "archive", "a.parquet")]
+
+
+def test_list_files_returns_regular_files_only(tmp_path):
+    _touch(tmp_path / "auctions" / "dataset.parquet" / "part-0.parquet")
+
+    files = LocalParquetWriter(tmp_path).list_files("auctions")
+
+    assert files == [os.path.join("auctions", "dataset.parquet", "part-0.parquet")]
@@ -0,0 +1,13 @@
+"""Tests for the helpers shared by ParquetStoragePort implementations."""
+
+from ports.parquet_storage import ParquetStoragePort
+
+
+def test_compression_level_kept_for_leveled_codecs_in_any_case():
+    for codec in ("zstd", "ZSTD", "Gzip"):
+        assert ParquetStoragePort._compression_options(codec, 3) == {"compression": codec.lower(), "compression_level": 3}
+
+
+def test_compression_level_dropped_for_codecs_without_levels():
+    assert ParquetStoragePort._compression_options("SNAPPY", 3) == {"compression": "snappy"}
+    assert ParquetStoragePort._compression_options("none", 3) == {"compression": None}